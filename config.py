@@ -12,6 +12,9 @@ DATA_URL = "https://raw.githubusercontent.com/kaz-Anova/Sentiment140/master/trai
 LIMITS = {'pos': 0.05, 'neg': -0.05}
 NEG_LIMIT = 40 
 
+SAMPLE_SEED = 42
+RESERVOIR_SIZE = 500
+
 BRAND_KEYWORDS = {
     'Airlines': ['flight', 'airline', 'delay', 'cancel', 'airport', 'plane', 'travel'],
     'Tech': ['iphone', 'google', 'apple', 'microsoft', 'phone', 'computer', 'software', 'bug'],
@@ -10,8 +10,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import config
 import data_loader
-import text_cleaner
-import sentiment_analyzer
+import sampler
 
 st.set_page_config(page_title="Enterprise Reputation Intelligence", layout="wide")
 
@@ -34,82 +33,89 @@ def load_massive_data():
     df = data_loader.load_data(n=50000) 
     return df
 
+@st.cache_resource
+def build_sample_index():
+    return sampler.StratifiedSample().extend(load_massive_data())
+
+@st.cache_resource
+def build_simulated_index(sector):
+    keywords = config.BRAND_KEYWORDS[sector]
+    return sampler.StratifiedSample(sectors={sector: keywords}).extend(simulate_signal(keywords))
+
+def simulate_signal(keywords):
+    rng = random.Random(config.SAMPLE_SEED)
+    dates = pd.date_range(end=pd.Timestamp.now().normalize(), periods=60)
+    
+    demo_texts = []
+    demo_dates = []
+    
+    for d in dates:
+        daily_vol = rng.randint(15, 30)
+        
+        for _ in range(daily_vol):
+            demo_dates.append(d)
+            seed = rng.random()
+            
+            if d.day % 7 == 0:
+                threshold = 0.7 
+            else:
+                threshold = 0.3
+
+            if seed < threshold:
+                phrases = [f"Terrible service from {keywords[0]}.", f"I hate {keywords[0]} delay.", f"{keywords[0]} disaster."]
+                demo_texts.append(rng.choice(phrases))
+            elif seed < 0.8:
+                phrases = [f"Love {keywords[0]}!", f"{keywords[0]} is great.", f"Amazing {keywords[0]}."]
+                demo_texts.append(rng.choice(phrases))
+            else:
+                phrases = [f"{keywords[0]} is okay.", f"Waiting on {keywords[0]}."]
+                demo_texts.append(rng.choice(phrases))
+
+    demo_data = {
+        'text': demo_texts,
+        'date': [d.strftime("%a %b %d %H:%M:%S PDT %Y") for d in demo_dates],
+        'target': [0] * len(demo_texts)
+    }
+    return pd.DataFrame(demo_data)
+
 df_full = load_massive_data()
+index = build_sample_index()
 
 st.sidebar.title("Enterprise Filters")
 sector = st.sidebar.selectbox("Market Sector", list(config.BRAND_KEYWORDS.keys()))
-keywords = config.BRAND_KEYWORDS[sector]
-vol = st.sidebar.slider("Analysis Depth (Rows)", 1000, 100000, 50000)
 
-final_df = pd.DataFrame()
+metrics = index.metrics(sector)
 
-if not df_full.empty and 'date' in df_full.columns:
-    sample_size = min(len(df_full), vol)
-    data_sample = df_full.sample(sample_size).copy()
+if metrics['total_count'] == 0:
+    st.toast(f"Low signal for {sector}. Activating High-Fidelity Simulation.")
+    index = build_simulated_index(sector)
 
-    data_sample['timestamp'] = pd.to_datetime(data_sample['date'].str.replace(' PDT ', ' '), errors='coerce')
-    data_sample = data_sample.dropna(subset=['timestamp'])
+start, end = index.span(sector)
 
-    if not data_sample.empty:
-        st.sidebar.subheader("Temporal Filtering")
-        min_date = data_sample['timestamp'].min().date()
-        max_date = data_sample['timestamp'].max().date()
-        selected_dates = st.sidebar.date_input("Analysis Window", [min_date, max_date])
+if start is not None:
+    st.sidebar.subheader("Temporal Filtering")
+    selected_dates = st.sidebar.date_input("Analysis Window", [start, end])
+    if len(selected_dates) == 2:
+        start, end = selected_dates
 
-    mask = data_sample['text'].str.contains('|'.join(keywords), case=False, na=False)
-    filtered_df = data_sample[mask]
+depth_max = index.depth_limit(sector, start, end)
+depth_min = min(1000, depth_max)
+if depth_min < depth_max:
+    vol = st.sidebar.slider("Analysis Depth (Rows)", depth_min, depth_max, min(50000, depth_max))
+else:
+    vol = depth_max
 
-    if filtered_df.empty:
-        st.toast(f"Low signal for {sector}. Activating High-Fidelity Simulation.")
-        
-        dates = pd.date_range(end=pd.Timestamp.now(), periods=60)
-        
-        demo_texts = []
-        demo_dates = []
-        
-        for d in dates:
-            daily_vol = random.randint(15, 30)
-            
-            for _ in range(daily_vol):
-                demo_dates.append(d)
-                seed = random.random()
-                
-                if d.day % 7 == 0:
-                    threshold = 0.7 
-                else:
-                    threshold = 0.3
-
-                if seed < threshold:
-                    phrases = [f"Terrible service from {keywords[0]}.", f"I hate {keywords[0]} delay.", f"{keywords[0]} disaster."]
-                    demo_texts.append(random.choice(phrases))
-                elif seed < 0.8:
-                    phrases = [f"Love {keywords[0]}!", f"{keywords[0]} is great.", f"Amazing {keywords[0]}."]
-                    demo_texts.append(random.choice(phrases))
-                else:
-                    phrases = [f"{keywords[0]} is okay.", f"Waiting on {keywords[0]}."]
-                    demo_texts.append(random.choice(phrases))
-
-        demo_data = {
-            'text': demo_texts,
-            'timestamp': demo_dates,
-            'date': [d.strftime("%a %b %d %H:%M:%S PDT %Y") for d in demo_dates],
-            'target': [0] * len(demo_texts)
-        }
-        filtered_df = pd.DataFrame(demo_data)
-
-    if not filtered_df.empty:
-        filtered_df = text_cleaner.process_batch(filtered_df)
-        final_df = sentiment_analyzer.analyze_sentiment(filtered_df)
+metrics = index.metrics(sector, start, end)
+final_df = index.draw(sector, vol, start, end)
 
 st.title(f"{sector.upper()} Reputation Intelligence")
 
-if not final_df.empty:
-    st.markdown(f"**Enterprise-grade monitoring for {len(final_df):,} live-indexed records**")
+if metrics['total_count']:
+    st.markdown(f"**Enterprise-grade monitoring for {metrics['total_count']:,} live-indexed records**")
 
     m1, m2, m3, m4 = st.columns(4)
-    total = len(final_df)
-    neg_pct = (len(final_df[final_df['vader_label'] == 'negative']) / total) * 100
-    pos_pct = (len(final_df[final_df['vader_label'] == 'positive']) / total) * 100
+    neg_pct = metrics['negative_pct']
+    pos_pct = metrics['positive_pct']
     
     m1.metric("Database Scale", f"{len(df_full):,}")
     m2.metric("Negative Volume", f"{neg_pct:.1f}%", delta="-2.4%", delta_color="inverse")
@@ -122,7 +128,11 @@ if not final_df.empty:
 
     with col_left:
         st.subheader("Sentiment Distribution")
-        fig_pie = px.pie(final_df, names='vader_label', hole=0.5,
+        label_counts = pd.DataFrame({
+            'vader_label': sampler.LABELS,
+            'count': [metrics[f'{label}_count'] for label in sampler.LABELS]
+        })
+        fig_pie = px.pie(label_counts, names='vader_label', values='count', hole=0.5,
                          color='vader_label',
                          color_discrete_map={
                              'positive': '#2ecc71',
@@ -134,9 +144,7 @@ if not final_df.empty:
 
     with col_right:
         st.subheader("Sentiment Trend (Time-Series)")
-        trend_df = final_df.copy()
-        trend_df['day'] = trend_df['timestamp'].dt.date
-        daily_trend = trend_df.groupby(['day', 'vader_label']).size().unstack(fill_value=0).reset_index()
+        daily_trend = index.daily(sector, start, end)
         
         fig_trend = go.Figure()
         
@@ -154,6 +162,7 @@ if not final_df.empty:
         st.plotly_chart(fig_trend, use_container_width=True)
 
     st.subheader("Reputation Drill-Down")
+    st.caption(f"Stratified sample of {len(final_df):,} records at depth {vol:,}")
     st.dataframe(final_df[['timestamp', 'text', 'vader_label']].head(50), use_container_width=True)
 
     if neg_pct > config.NEG_LIMIT:
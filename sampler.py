@@ -0,0 +1,120 @@
+import math
+import pandas as pd
+import config
+import text_cleaner
+import sentiment_analyzer
+
+STRATA = ['sector', 'day', 'vader_label']
+LABELS = ['negative', 'neutral', 'positive']
+KEEP = STRATA + ['timestamp', 'text', 'clean_text', 'vader_score', 'sample_key']
+
+def _stack(old, new):
+    return new if old.empty else pd.concat([old, new], ignore_index=True)
+
+class StratifiedSample:
+    # Exact per-stratum counts back the headline metrics; the bottom-k
+    # reservoir per (sector, day, label) only feeds the drill-down.
+
+    def __init__(self, seed=config.SAMPLE_SEED, capacity=config.RESERVOIR_SIZE, sectors=None):
+        self.seed = seed
+        self.capacity = capacity
+        self.sectors = sectors or config.BRAND_KEYWORDS
+        self.rows = 0
+        self.seen = set()
+        self.totals = pd.DataFrame(columns=STRATA + ['count'])
+        self.reservoir = pd.DataFrame(columns=KEEP)
+
+    def _keys(self, df):
+        # Hashing row content keeps each row's priority independent of batch
+        # order, so extending with new rows never reshuffles the sample.
+        cols = [c for c in ('id', 'date', 'text') if c in df.columns]
+        hash_key = f"{self.seed:016d}"[-16:]
+        return pd.util.hash_pandas_object(df[cols], index=False, hash_key=hash_key).to_numpy()
+
+    def extend(self, df):
+        # Rows already ingested (same key) are skipped, so overlapping batches
+        # never double-count the exact totals.
+        df = df.copy().reset_index(drop=True)
+        df['timestamp'] = pd.to_datetime(df['date'].astype(str).str.replace(' PDT ', ' '), errors='coerce')
+        df = df.dropna(subset=['timestamp'])
+        df['sample_key'] = self._keys(df)
+        df = df[~df['sample_key'].isin(self.seen)].drop_duplicates('sample_key')
+        self.seen.update(df['sample_key'])
+        self.rows += len(df)
+
+        hits = pd.DataFrame({
+            name: df['text'].str.contains('|'.join(words), case=False, na=False)
+            for name, words in self.sectors.items()
+        }, index=df.index)
+        df = df[hits.any(axis=1)].copy()
+        if df.empty:
+            return self
+
+        df = text_cleaner.process_batch(df)
+        df = sentiment_analyzer.analyze_sentiment(df)
+        df['day'] = df['timestamp'].dt.date
+
+        tagged = pd.concat([df[hits.loc[df.index, name]].assign(sector=name) for name in self.sectors])
+
+        counts = tagged.groupby(STRATA).size().reset_index(name='count')
+        self.totals = _stack(self.totals, counts).groupby(STRATA, as_index=False)['count'].sum()
+
+        pool = _stack(self.reservoir, tagged[KEEP])
+        pool = pool.sort_values('sample_key', kind='stable')
+        self.reservoir = pool.groupby(STRATA, sort=False).head(self.capacity).reset_index(drop=True)
+        return self
+
+    def _window(self, frame, sector, start=None, end=None):
+        mask = frame['sector'] == sector
+        if start is not None:
+            mask &= frame['day'] >= start
+        if end is not None:
+            mask &= frame['day'] <= end
+        return frame[mask]
+
+    def span(self, sector):
+        days = self._window(self.totals, sector)['day']
+        if days.empty:
+            return None, None
+        return days.min(), days.max()
+
+    def metrics(self, sector, start=None, end=None):
+        counts = self._window(self.totals, sector, start, end).groupby('vader_label')['count'].sum()
+        total = int(counts.sum())
+
+        metrics = {'total_count': total}
+        for label in LABELS:
+            n = int(counts.get(label, 0))
+            metrics[f'{label}_count'] = n
+            metrics[f'{label}_pct'] = (n / total) * 100 if total else 0.0
+        return metrics
+
+    def daily(self, sector, start=None, end=None):
+        window = self._window(self.totals, sector, start, end)
+        return window.pivot_table(index='day', columns='vader_label', values='count',
+                                  aggfunc='sum', fill_value=0).reset_index()
+
+    def depth_limit(self, sector, start=None, end=None):
+        # Past this depth the largest stratum has exhausted its reservoir, so
+        # draw() returns the same rows for any deeper request.
+        counts = self._window(self.totals, sector, start, end)['count']
+        if counts.empty:
+            return 0
+        return min(self.rows, math.ceil(self.rows * self.capacity / counts.max()))
+
+    def draw(self, sector, depth, start=None, end=None):
+        pool = self._window(self.reservoir, sector, start, end)
+        if pool.empty or not self.rows:
+            return pool
+
+        # Each stratum contributes what a depth-row uniform sample of the corpus
+        # would hold; the reservoir is key-sorted, so quotas are nested prefixes.
+        # The fraction is capped so no stratum asks for more than the reservoir
+        # holds, which keeps the strata in proportion once depth passes that cap.
+        counts = self._window(self.totals, sector, start, end).set_index(STRATA)['count']
+        fraction = min(depth / self.rows, 1.0, self.capacity / counts.max())
+        quotas = (counts * fraction).apply(math.ceil)
+
+        rank = pool.groupby(STRATA).cumcount().to_numpy()
+        quota = quotas.reindex(pd.MultiIndex.from_frame(pool[STRATA])).to_numpy()
+        return pool[rank < quota]
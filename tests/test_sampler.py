@@ -0,0 +1,114 @@
+import sys
+import os
+import math
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import sampler
+
+def make_corpus(n=600):
+    moods = ['I hate this', 'I love this', 'waiting on this']
+    subjects = ['flight', 'bank', 'pizza', 'google phone', 'weather']
+    return pd.DataFrame({
+        'id': range(n),
+        'date': [f"Mon Apr {6 + i % 4:02d} 22:19:45 PDT 2009" for i in range(n)],
+        'text': [f"{moods[i % 3]} {subjects[i % 5]} {i}" for i in range(n)],
+    })
+
+def make_skewed_corpus(volumes={6: 200, 7: 40, 8: 10}):
+    rows = [(day, i) for day, n in volumes.items() for i in range(n)]
+    return pd.DataFrame({
+        'id': range(len(rows)),
+        'date': [f"Mon Apr {day:02d} 22:19:45 PDT 2009" for day, _ in rows],
+        'text': [f"terrible flight {i}" for _, i in rows],
+    })
+
+def ordered(frame, by):
+    return frame.sort_values(by).reset_index(drop=True)
+
+def test_chunked_build_matches_one_shot():
+    corpus = make_corpus()
+    shuffled = corpus.sample(frac=1, random_state=7)
+    chunks = [shuffled.iloc[i:i + 150] for i in range(0, len(shuffled), 150)]
+
+    one_shot = sampler.StratifiedSample(capacity=10).extend(corpus)
+    chunked = sampler.StratifiedSample(capacity=10)
+    for chunk in chunks:
+        chunked.extend(chunk)
+
+    assert chunked.rows == one_shot.rows
+    pd.testing.assert_frame_equal(ordered(chunked.totals, sampler.STRATA),
+                                  ordered(one_shot.totals, sampler.STRATA))
+    pd.testing.assert_frame_equal(ordered(chunked.reservoir, sampler.STRATA + ['sample_key']),
+                                  ordered(one_shot.reservoir, sampler.STRATA + ['sample_key']))
+
+def test_repeated_index_batch():
+    corpus = make_corpus()
+    batch = pd.concat([corpus.iloc[:300], corpus.iloc[300:].reset_index(drop=True)])
+    assert not batch.index.is_unique
+
+    repeated = sampler.StratifiedSample(capacity=10).extend(batch)
+    one_shot = sampler.StratifiedSample(capacity=10).extend(corpus)
+
+    pd.testing.assert_frame_equal(ordered(repeated.totals, sampler.STRATA),
+                                  ordered(one_shot.totals, sampler.STRATA))
+
+def test_draw_quotas_are_nested_prefixes():
+    index = sampler.StratifiedSample(capacity=50).extend(make_corpus())
+
+    previous = set()
+    for depth in [10, 50, 200, 600]:
+        drawn = set(index.draw('Airlines', depth)['sample_key'])
+        assert previous <= drawn
+        previous = drawn
+
+    assert len(previous) == index.metrics('Airlines')['total_count']
+
+def test_draw_keeps_strata_in_proportion_at_full_depth():
+    index = sampler.StratifiedSample(capacity=10).extend(make_skewed_corpus())
+
+    counts = index.totals.set_index(sampler.STRATA)['count']
+    drawn = index.draw('Airlines', index.rows).groupby(sampler.STRATA).size()
+
+    expected = (counts * 10 / counts.max()).apply(math.ceil)
+    assert drawn.reindex(expected.index).tolist() == expected.tolist()
+    assert drawn.sum() < len(index.reservoir)
+
+def test_depth_limit_is_where_draw_stops_growing():
+    index = sampler.StratifiedSample(capacity=10).extend(make_skewed_corpus())
+
+    limit = index.depth_limit('Airlines')
+    assert limit < index.rows
+    at_limit = index.draw('Airlines', limit)['sample_key'].tolist()
+    assert at_limit == index.draw('Airlines', index.rows)['sample_key'].tolist()
+    assert len(index.draw('Airlines', limit // 2)) < len(at_limit)
+
+def test_overlapping_batches_are_not_double_counted():
+    corpus = make_corpus()
+
+    index = sampler.StratifiedSample(capacity=10).extend(corpus).extend(corpus.iloc[:10])
+    one_shot = sampler.StratifiedSample(capacity=10).extend(corpus)
+
+    assert index.rows == one_shot.rows
+    pd.testing.assert_frame_equal(ordered(index.totals, sampler.STRATA),
+                                  ordered(one_shot.totals, sampler.STRATA))
+    assert index.reservoir.duplicated(['sector', 'sample_key']).sum() == 0
+
+@pytest.mark.parametrize('corpus', [
+    pd.DataFrame({'date': pd.Series(dtype=object), 'text': pd.Series(dtype=object)}),
+    pd.DataFrame({
+        'target': [0, 4], 'date': ['Mon May 11 2009', 'Mon May 11 2009'],
+        'text': ['Error loading remote data', 'System in fallback mode'],
+        'label': ['negative', 'positive']
+    }),
+])
+def test_empty_corpus(corpus):
+    index = sampler.StratifiedSample().extend(corpus)
+
+    for sector in index.sectors:
+        assert index.metrics(sector)['total_count'] == 0
+        assert index.span(sector) == (None, None)
+        assert index.draw(sector, 1000).empty